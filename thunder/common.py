@@ -1,9 +1,10 @@
 import dis
+import os
 from typing import Any
 from collections.abc import Callable, Generator, Hashable, Sequence
-from collections import deque, defaultdict
+from collections import defaultdict
+import threading
 import time
-from functools import wraps
 from io import StringIO
 
 from thunder.core.options import (
@@ -43,6 +44,7 @@ from thunder.core.transforms import autocast
 from thunder.core.dtypes import to_dtype
 
 import torch as torch
+from torch.utils.weak import WeakTensorKeyDictionary
 import numpy as np
 import thunder
 
@@ -93,8 +95,47 @@ class CompileStats:
         cache_hits (int):
         cache_misses (int):
         last_compile_reasons (dict):
+        record_timings (bool):
     """
 
+    # NOTE __slots__ avoids allocating a per-instance __dict__ and makes the attribute
+    #   stores and loads that _fn performs on every call C-level slot accesses
+    __slots__ = (
+        "last_executed",
+        "last_traces",
+        "last_prologue",
+        "last_prologue_traces",
+        "last_interpreted_instructions",
+        "last_interpreter_log",
+        "last_backward_traces",
+        "last_trace_host_start",
+        "last_trace_host_stop",
+        "last_trace_cache_start",
+        "last_trace_cache_stop",
+        "last_trace_tracing_start",
+        "last_trace_tracing_stop",
+        "last_trace_host_tracing_start",
+        "last_trace_host_tracing_stop",
+        "last_trace_host_execution_start",
+        "last_trace_host_execution_stop",
+        "last_prologue_transformation_start",
+        "last_prologue_transformation_stop",
+        "last_prologue_execution_start",
+        "last_prologue_execution_stop",
+        "last_computation_transformation_start",
+        "last_computation_transformation_stop",
+        "last_computation_execution_start",
+        "last_computation_execution_stop",
+        "cache",
+        "_specialized_key_fn",
+        "interpreter_cache",
+        "calls",
+        "cache_hits",
+        "cache_misses",
+        "last_compile_reasons",
+        "record_timings",
+    )
+
     def __init__(self):
         # Callables and traces
         self.last_executed = None
@@ -114,6 +155,8 @@ class CompileStats:
         self.last_trace_cache_stop: int = -1
         self.last_trace_tracing_start: int = -1
         self.last_trace_tracing_stop: int = -1
+        self.last_trace_host_tracing_start: int = -1
+        self.last_trace_host_tracing_stop: int = -1
         self.last_trace_host_execution_start: int = -1
         self.last_trace_host_execution_stop: int = -1
 
@@ -128,6 +171,9 @@ class CompileStats:
 
         # Cache stats
         self.cache = {}
+        # Cache-key function specialized to the callable's argument types, generated
+        #   lazily on the first lookup (see _make_specialized_key_fn)
+        self._specialized_key_fn = None
         self.interpreter_cache: list = []
         self.calls: int = 0
         self.cache_hits: int = 0
@@ -136,6 +182,11 @@ class CompileStats:
         # Compiler option stats
         self.last_compile_reasons: dict = defaultdict(list)
 
+        # Controls whether thunder.compile's callable records the per-call timestamps
+        #   above; disabled by default so the cache-hit fast path skips the
+        #   time.perf_counter_ns() bookkeeping entirely (see enable_timings)
+        self.record_timings: bool = False
+
     def _time_template(self, start: int, stop: int, desc: str, /) -> int:
         if start < 0 or stop < 0 or stop < start:
             if start == -1 and stop == -1:
@@ -281,6 +332,18 @@ class CompileData:
         assert disable_preprocessing, "please use thunder.compile if you need preprocessing"
 
 
+# Per-thread scratch containers for _unpack_inputs, reused across calls to reduce
+#   allocation and GC pressure on the tracing path
+_unpack_scratch = threading.local()
+
+# Exact-type dispatch sets for _unpack_inputs' translate, consulted before the general
+#   isinstance chain so that common leaves are resolved with a single membership test
+#   instead of up to four isinstance calls
+_translate_proxyable_types = frozenset((bool, int, float, complex, torch.Tensor))
+_translate_collection_types = frozenset((list, tuple, dict))
+_translate_identity_types = frozenset((str, type(None)))
+
+
 # Common UX functions
 def _unpack_inputs(fn, tracectx: TraceCtx, args, kwargs, *, rename_proxies: bool):
     tracectx.unpacking()
@@ -297,6 +360,17 @@ def _unpack_inputs(fn, tracectx: TraceCtx, args, kwargs, *, rename_proxies: bool
         #   One alternative would be to modify the function's signature to include
         #   the name of the proxy, but that might require a lot of changes to the
         #   codebase.
+        cls = type(x)
+        if cls in _translate_proxyable_types:
+            return proxy(x, name=name)
+        if cls in _translate_identity_types:
+            return x
+        if cls is torch.dtype:
+            return to_dtype(x)
+        if cls in _translate_collection_types:
+            return tree_map(translate, x)
+
+        # General path for subclasses and less common types
         if is_proxyable(x):
             return proxy(x, name=name)
 
@@ -316,54 +390,66 @@ def _unpack_inputs(fn, tracectx: TraceCtx, args, kwargs, *, rename_proxies: bool
     si = get_siginfo(fn, args, kwargs)
 
     # Constructs args
-    cq = deque()
+    # NOTE The collection worklist is always drained before this function returns, so
+    #   the container itself can be pooled per thread (unlike proxyargs and
+    #   proxykwargs, which are handed to the caller)
+    cq = getattr(_unpack_scratch, "cq", None)
+    if cq is None:
+        cq = _unpack_scratch.cq = []
+    else:
+        cq.clear()
     proxyargs = []
+    proxykwargs = {}
+
+    # Accumulates (name, translated, always_queue) triples so that all the
+    #   unpack_trivial symbols are recorded in one batched loop below
+    pending = []
     for name, x in si.args:
         translated = translate(x, name=name)
         proxyargs.append(translated)
-
-        unpacked = prims.unpack_trivial(translated, name=name)
-        if isinstance(unpacked, CollectionProxy):
-            cq.append(unpacked)
+        pending.append((name, translated, False))
 
     # Handles varargs
     if si.varargs is not None:
         varargs_name, x = si.varargs
-
         translated = translate(x)
         proxyargs.extend(translated)
+        pending.append((varargs_name, translated, True))
 
-        unpacked = prims.unpack_trivial(translated, name=varargs_name)
-        cq.append(unpacked)
-
-    proxykwargs = {}
     for name, x in si.kwargs.items():
         translated = translate(x, name=name)
         proxykwargs[name] = translated
-
-        unpacked = prims.unpack_trivial(translated, name=name)
-        if isinstance(unpacked, CollectionProxy):
-            cq.append(unpacked)
+        pending.append((name, translated, False))
 
     if si.varkwargs is not None:
         varkwargs_name, x = si.varkwargs
-
         translated = translate(x)
         proxykwargs.update(translated)
-
-        unpacked = prims.unpack_trivial(translated, name=varkwargs_name)
-        cq.append(unpacked)
+        pending.append((varkwargs_name, translated, True))
+
+    # Records the unpacks in a single pass with the symbol lookup hoisted out of
+    #   the loop
+    unpack_trivial = prims.unpack_trivial
+    for name, translated, always_queue in pending:
+        unpacked = unpack_trivial(translated, name=name)
+        if always_queue or isinstance(unpacked, CollectionProxy):
+            cq.append(unpacked)
 
     # Unpacks collections to introduce proxy names to the trace
-    while True:
-        try:
-            c = cq.popleft()
-            unpacked = prims.unpack(c)
-            for u in unpacked:
-                if isinstance(u, CollectionProxy):
-                    cq.append(u)
-        except IndexError:
-            break
+    # NOTE The worklist is drained FIFO because downstream passes rely on the
+    #   breadth-first unpack order (e.g. split_forward_backward indexes the
+    #   unpack bound symbols by position); the cursor avoids popleft/deque
+    #   overhead while keeping that order
+    i = 0
+    while i < len(cq):
+        c = cq[i]
+        i += 1
+        for u in prims.unpack(c):
+            if isinstance(u, CollectionProxy):
+                cq.append(u)
+    # The cursor leaves the drained entries in place, so the pooled list is
+    #   emptied here to not keep the proxies alive across calls
+    cq.clear()
 
     tracectx.unpacked()
     return proxyargs, proxykwargs
@@ -375,9 +461,25 @@ def _unpack_inputs(fn, tracectx: TraceCtx, args, kwargs, *, rename_proxies: bool
 # TODO We could look at supporting non-hashable inputs, like dicts
 
 
+# Memoizes tensor subkeys on tensor identity
+# NOTE Cache keys are commonly rebuilt for the same tensor objects on every call
+#   (e.g. module parameters), and reading the four metadata attributes plus allocating
+#   a fresh tuple per call is pure overhead in those cases
+# NOTE requires_grad is the only cached attribute that is commonly changed in-place,
+#   so it's verified on every lookup
+_tensor_subkey_cache = WeakTensorKeyDictionary()
+
+
 # TODO Update cacheable types
 def _make_subkey_for(x: Any) -> tuple[bool, None | tuple]:
-    if isinstance(x, (torch.Tensor, TensorProxy)):
+    if isinstance(x, torch.Tensor):
+        subkey = _tensor_subkey_cache.get(x)
+        if subkey is None or subkey[4] is not x.requires_grad:
+            subkey = (type(x), x.shape, x.device, x.dtype, x.requires_grad)
+            _tensor_subkey_cache[x] = subkey
+        return True, subkey
+
+    if isinstance(x, TensorProxy):
         return True, (type(x), x.shape, x.device, x.dtype, x.requires_grad)
 
     # TODO Add NumPy ndarray support
@@ -389,6 +491,12 @@ def _make_subkey_for(x: Any) -> tuple[bool, None | tuple]:
         return True, (str, x)
 
     if isinstance(x, Sequence):
+        # Fast path for homogeneous int sequences (commonly shapes, strides, and dims),
+        #   which packs the values into the subkey directly instead of recursing once
+        #   per element
+        if all(type(v) is int for v in x):
+            return True, (tuple, tuple(x))
+
         key = [None] * len(x)
         for idx, v in enumerate(x):
             is_hashable, subkey = _make_subkey_for(v)
@@ -407,11 +515,40 @@ def _make_subkey_for(x: Any) -> tuple[bool, None | tuple]:
     return False, None
 
 
-# Private class just to separate objects in the cache
+# Private class separating the positional-argument subkeys from the keyword-argument
+#   subkeys in a cache key
+# NOTE The class object itself is used as a unique singleton marker; no valid subkey
+#   can collide with it
 class _key_value_separator:
     pass
 
 
+# Private exception used by _fast_subkey to abandon the fast path
+class _SubkeyFallback(Exception):
+    pass
+
+
+# Fast-path version of _make_subkey_for for the common argument types
+# NOTE This must produce exactly the same subkeys as _make_subkey_for so that keys
+#   constructed on the fast path match keys constructed on the general path
+def _fast_subkey(x: Any) -> tuple:
+    cls = type(x)
+    if cls is torch.Tensor:
+        subkey = _tensor_subkey_cache.get(x)
+        if subkey is None or subkey[4] is not x.requires_grad:
+            subkey = (torch.Tensor, x.shape, x.device, x.dtype, x.requires_grad)
+            _tensor_subkey_cache[x] = subkey
+        return subkey
+    if cls is TensorProxy:
+        return (TensorProxy, x.shape, x.device, x.dtype, x.requires_grad)
+    if cls is str:
+        return (str, x)
+    if cls is int or cls is float or cls is bool:
+        return (cls, x)
+
+    raise _SubkeyFallback
+
+
 # Returns a hashable key or None if the given args and kwargs are not hashable
 def _make_cache_key(
     args,
@@ -419,7 +556,33 @@ def _make_cache_key(
     autocast_key=None,
     distributed_key=None,
 ) -> None | tuple:
-    key = [None] * (len(args) + len(kwargs))
+    # Fast path for the common case where every arg and kwarg is a tensor, a string,
+    #   or a number, which constructs the key with two tuple expressions instead of
+    #   a preallocated list and per-element isinstance dispatch
+    try:
+        key = tuple(_fast_subkey(arg) for arg in args)
+        if kwargs:
+            key += (_key_value_separator,) + tuple((k, _fast_subkey(v)) for k, v in kwargs.items())
+        if autocast_key is not None:
+            key += tuple(autocast_key)
+        if distributed_key is not None:
+            key += tuple(distributed_key)
+        return key
+    except _SubkeyFallback:
+        pass
+
+    return _make_cache_key_general(args, kwargs, autocast_key, distributed_key)
+
+
+# The general (slow) path of _make_cache_key, which handles sequences, arbitrary
+#   hashable objects, and unhashable inputs
+def _make_cache_key_general(
+    args,
+    kwargs,
+    autocast_key=None,
+    distributed_key=None,
+) -> None | tuple:
+    key = [None] * len(args)
 
     # Constructs arg portion of key
     for idx, arg in enumerate(args):
@@ -429,20 +592,16 @@ def _make_cache_key(
         key[idx] = subkey
 
     # Constructs kwarg portion of key
-
-    def kwarg_helper(key, value) -> tuple[bool, None | tuple]:
-        is_key_hashable, key_key = _make_subkey_for(key)
-        is_value_hashable, value_key = _make_subkey_for(value)
-
-        return is_key_hashable and is_value_hashable, (key_key, _key_value_separator, value_key)
-
-    offset = len(args)
-    for idx, (k, v) in enumerate(kwargs.items()):
-        is_hashable, subkey = kwarg_helper(k, v)
-        if not is_hashable:
-            return None
-
-        key[offset + idx] = subkey
+    # NOTE Keyword names are Python identifiers (strings), so each entry is just the
+    #   name paired with the value's subkey; a single separator distinguishes the
+    #   kwarg section from the positional section
+    if kwargs:
+        key.append(_key_value_separator)
+        for k, v in kwargs.items():
+            is_hashable, subkey = _make_subkey_for(v)
+            if not is_hashable:
+                return None
+            key.append((k, subkey))
 
     if autocast_key is not None:
         key += autocast_key
@@ -452,6 +611,107 @@ def _make_cache_key(
     return tuple(key)
 
 
+# Private exception raised by generated cache-key functions when the call signature
+#   they were specialized for no longer matches the actual arguments
+class _KeySpecializationMiss(Exception):
+    pass
+
+
+# Maps cacheable argument types to the source expressions constructing their subkeys
+# NOTE The expressions must produce exactly the same subkeys as _make_subkey_for so
+#   that specialized keys and generally constructed keys are interchangeable
+_subkey_exprs: dict[type, str] = {
+    torch.Tensor: "(torch.Tensor, {x}.shape, {x}.device, {x}.dtype, {x}.requires_grad)",
+    TensorProxy: "(TensorProxy, {x}.shape, {x}.device, {x}.dtype, {x}.requires_grad)",
+    str: "(str, {x})",
+    int: "(int, {x})",
+    float: "(float, {x})",
+    bool: "(bool, {x})",
+}
+
+_subkey_type_names: dict[type, str] = {
+    torch.Tensor: "torch.Tensor",
+    TensorProxy: "TensorProxy",
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+}
+
+
+# Generates a cache-key function specialized to the exact types of the given args and
+#   kwargs
+# The shape of (args, kwargs) is nearly always fixed per compiled callable, so the
+#   generated function replaces the per-argument type dispatch of _make_cache_key with
+#   straight-line attribute reads guarded by a single type check per argument
+# Returns _make_cache_key when an argument's type can't be specialized
+def _make_specialized_key_fn(args, kwargs) -> Callable:
+    arg_types = tuple(type(arg) for arg in args)
+    kwarg_types = tuple((k, type(v)) for k, v in kwargs.items())
+
+    if any(typ not in _subkey_exprs for typ in arg_types) or any(typ not in _subkey_exprs for _, typ in kwarg_types):
+        return _make_cache_key
+
+    lines = [
+        "def _specialized_cache_key(args, kwargs, autocast_key=None, distributed_key=None):",
+        f"    if len(args) != {len(arg_types)} or len(kwargs) != {len(kwarg_types)}:",
+        "        raise _KeySpecializationMiss",
+    ]
+
+    guards = []
+    subkeys = []
+    for idx, typ in enumerate(arg_types):
+        x = f"a{idx}"
+        lines.append(f"    {x} = args[{idx}]")
+        guards.append(f"type({x}) is {_subkey_type_names[typ]}")
+        subkeys.append(_subkey_exprs[typ].format(x=x))
+    if kwarg_types:
+        subkeys.append("_key_value_separator")
+    for idx, (k, typ) in enumerate(kwarg_types):
+        x = f"v{idx}"
+        lines.append(f"    {x} = kwargs[{k!r}]")
+        guards.append(f"type({x}) is {_subkey_type_names[typ]}")
+        subkeys.append(f"({k!r}, {_subkey_exprs[typ].format(x=x)})")
+
+    if guards:
+        lines.append(f"    if not ({' and '.join(guards)}):")
+        lines.append("        raise _KeySpecializationMiss")
+
+    lines.append(f"    key = ({', '.join(subkeys)}{',' if subkeys else ''})")
+    lines.append("    if autocast_key is not None:")
+    lines.append("        key += tuple(autocast_key)")
+    lines.append("    if distributed_key is not None:")
+    lines.append("        key += tuple(distributed_key)")
+    lines.append("    return key")
+
+    namespace = {
+        "torch": torch,
+        "TensorProxy": TensorProxy,
+        "_key_value_separator": _key_value_separator,
+        "_KeySpecializationMiss": _KeySpecializationMiss,
+    }
+    exec(compile("\n".join(lines), "<thunder specialized cache key>", "exec"), namespace)
+    return namespace["_specialized_cache_key"]
+
+
+# Constructs a cache key using the compiled callable's specialized key function,
+#   generating it on first use and falling back to _make_cache_key when the call
+#   signature changes
+# NOTE A miss permanently pins the callable to _make_cache_key; respecializing
+#   would make workloads that alternate between two signatures pay the
+#   exec/compile codegen cost on every other call
+def _cache_key_for(cs, args, kwargs, autocast_key=None, distributed_key=None) -> None | tuple:
+    key_fn = cs._specialized_key_fn
+    if key_fn is None:
+        key_fn = cs._specialized_key_fn = _make_specialized_key_fn(args, kwargs)
+
+    try:
+        return key_fn(args, kwargs, autocast_key, distributed_key)
+    except (_KeySpecializationMiss, KeyError):
+        cs._specialized_key_fn = _make_cache_key
+        return _make_cache_key(args, kwargs, autocast_key, distributed_key)
+
+
 # construct cache key for autocast operations
 def _make_autocast_cache_key(
     is_autocast_enabled, is_autocast_cpu_enabled, autocast_gpu_dtype, autocast_cpu_dtype
@@ -465,6 +725,11 @@ def _make_distributed_cache_key(
     return [no_grad_sync]
 
 
+# Singleton cache-miss sentinel, so lookups don't allocate a fresh (None, None) tuple
+#   per call
+_MISS: tuple[None, None] = (None, None)
+
+
 # Returns True if successfully cached, false otherwise
 def cache_put(
     cache: dict,
@@ -492,7 +757,7 @@ def cache_get(
     distributed_key=None,
 ) -> tuple[None | Callable, None | Sequence[TraceCtx]]:
     key = _make_cache_key(args, kwargs, autocast_key, distributed_key)
-    return cache.get(key, (None, None))
+    return cache.get(key, _MISS)
 
 
 # Produces a trace of the given function with the given args and kwargs
@@ -513,6 +778,14 @@ def cache_get(
 #   to separate the traced function's args and kwargs from this function's kwargs
 from thunder.core.interpreter import InterpreterLogItem, make_opaque
 
+# Traces with fewer bound symbols than this skip the dead-code-elimination pass in
+#   trace(); on trivially small traces DCE's setup cost outweighs what it can remove,
+#   and transform_for_execution reruns DCE before execution anyway.
+# NOTE The default of 0 keeps the elision off, because callers inspect the trace
+#   that trace() returns and rely on use_dce being honored (e.g. the trace-shape
+#   assertions in test_core.py); setting the variable is a measured opt-in
+_DCE_MIN_OPS: int = int(os.environ.get("THUNDER_DCE_MIN_OPS", "0"))
+
 
 def trace(
     compile_data: None | CompileData = None,
@@ -591,7 +864,7 @@ def trace(
 
             # TODO Stop calling this here and make it a separate trace in the sequence
             #   of traces
-            if use_dce:
+            if use_dce and len(trace.bound_symbols) >= _DCE_MIN_OPS:
                 trace = dce(trace)
 
         finally:
@@ -688,6 +961,46 @@ def _execute_trace(
 #   a helper to convert torch tensors to NumPy arrays on output?
 
 
+# Returns True if any tensor (or tensor proxy) in the given object requires grad
+# NOTE This is an early-exit alternative to flattening the object with tree_flatten and
+#   scanning the flat list, which walks and allocates proportionally to the number of
+#   leaves even when the very first tensor requires grad
+def _any_requires_grad(x: Any) -> bool:
+    if isinstance(x, (torch.Tensor, TensorProxy)):
+        return x.requires_grad
+    if isinstance(x, (list, tuple)):
+        return any(_any_requires_grad(v) for v in x)
+    if isinstance(x, dict):
+        return any(_any_requires_grad(v) for v in x.values())
+    if is_collection(x):
+        flat, _ = tree_flatten(x)
+        return any(_any_requires_grad(v) for v in flat)
+    return False
+
+
+# Copies just the identifying metadata from fn onto the wrapper
+# NOTE This is a cheaper functools.wraps: it skips copying __module__, __doc__, and
+#   (notably) updating the wrapper's __dict__ from fn's, which is wasted work when many
+#   callables are compiled -- and actively harmful when fn is an nn.Module, whose whole
+#   instance __dict__ functools.wraps would copy onto the wrapper
+def _light_wraps(fn: Callable, wrapper: Callable) -> Callable:
+    name = getattr(fn, "__name__", None)
+    if name is not None:
+        wrapper.__name__ = name
+        wrapper.__qualname__ = getattr(fn, "__qualname__", name)
+    wrapper.__wrapped__ = fn
+    return wrapper
+
+
+# Enables per-call timing collection on a callable produced by thunder.compile
+# NOTE Timing collection is disabled by default because the timestamps are pure
+#   bookkeeping on the cache-hit fast path unless they're actually queried
+def enable_timings(fn) -> None:
+    cs = getattr(fn, "_lc_cs", None)
+    check(cs is not None, lambda: f"{fn} doesn't seem to be a thunder compiled function")
+    cs.record_timings = True
+
+
 # NOTE: Do not use this function and do not update it.
 # Use `thunder.jit` instead.
 def _create_callable(
@@ -698,9 +1011,22 @@ def _create_callable(
     transforms = []
     _using_grad_transform = False
 
-    @wraps(cd.fn)
+    # NOTE The cache option is fixed at compile time, so the per-call branch conditions
+    #   (and the objects they consult) are resolved here and captured as closure locals,
+    #   saving the attribute loads and identity comparisons on every call
+    uses_same_input_cache: bool = cd.cache_option is CACHE_OPTIONS.SAME_INPUT
+    uses_constant_values_cache: bool = cd.cache_option is CACHE_OPTIONS.CONSTANT_VALUES
+    cache: dict = cs.cache
+    num_constant_args: int = cd.num_constant_args
+
+    # Caches the autocast-wrapped function per autocast dtype, so the wrapper is
+    #   constructed once instead of on every call with autocast enabled
+    autocast_fn_cache: dict = {}
+
     def _fn(*args, **kwargs) -> tuple[Any, list[TraceCtx]]:
-        cs.last_trace_host_start = time.perf_counter_ns()
+        record_timings: bool = cs.record_timings
+        if record_timings:
+            cs.last_trace_host_start = time.perf_counter_ns()
         cs.calls += 1
 
         # autocast related operations
@@ -730,38 +1056,52 @@ def _create_callable(
 
         # Tries to lookup a callable in a cache
         # TODO Return the previous traces when caching
-        cs.last_trace_cache_start = time.perf_counter_ns()
-        if cd.cache_option is CACHE_OPTIONS.SAME_INPUT and cs.last_executed is not None:
+        if record_timings:
+            cs.last_trace_cache_start = time.perf_counter_ns()
+        if uses_same_input_cache and cs.last_executed is not None:
             # TODO Update _last_traces?
             # Updates statistics before early termination
             cs.cache_hits += 1
-            cs.last_trace_cache_stop = time.perf_counter_ns()
-            cs.last_trace_tracing_start = -1
-            cs.last_trace_tracing_stop = -1
-            cs.last_trace_host_execution_start = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_cache_stop = time.perf_counter_ns()
+                cs.last_trace_tracing_start = -1
+                cs.last_trace_tracing_stop = -1
+                cs.last_trace_host_execution_start = time.perf_counter_ns()
             result = cs.last_executed(*args, **kwargs)
-            cs.last_trace_host_execution_stop = time.perf_counter_ns()
-            cs.last_trace_host_stop = cs.last_trace_host_execution_stop
+            if record_timings:
+                cs.last_trace_host_execution_stop = time.perf_counter_ns()
+                cs.last_trace_host_stop = cs.last_trace_host_execution_stop
             return result
-        if cd.cache_option is CACHE_OPTIONS.CONSTANT_VALUES:
-            c, _ = cache_get(cs.cache, args[cd.num_constant_args :], kwargs, autocast_key, distributed_key)
+        if uses_constant_values_cache:
+            key = _cache_key_for(cs, args[num_constant_args:], kwargs, autocast_key, distributed_key)
+            c = cache.get(key, _MISS)[0] if key is not None else None
             if c is not None:
                 # Updates statistics before early termination
                 cs.cache_hits += 1
                 cs.last_executed = c
-                cs.last_trace_cache_stop = time.perf_counter_ns()
-                cs.last_trace_tracing_start = -1
-                cs.last_trace_tracing_stop = -1
-                cs.last_trace_host_execution_start = time.perf_counter_ns()
+                if record_timings:
+                    cs.last_trace_cache_stop = time.perf_counter_ns()
+                    cs.last_trace_tracing_start = -1
+                    cs.last_trace_tracing_stop = -1
+                    cs.last_trace_host_execution_start = time.perf_counter_ns()
                 result = c(*args, **kwargs)
-                cs.last_trace_host_execution_stop = time.perf_counter_ns()
-                cs.last_trace_host_stop = cs.last_trace_host_execution_stop
+                if record_timings:
+                    cs.last_trace_host_execution_stop = time.perf_counter_ns()
+                    cs.last_trace_host_stop = cs.last_trace_host_execution_stop
                 return result
         cs.cache_misses += 1
-        cs.last_trace_cache_stop = time.perf_counter_ns()
+        if record_timings:
+            cs.last_trace_cache_stop = time.perf_counter_ns()
 
         # Applies the autocast transform if PyTorch's autocast behavior is enabled
-        processed_function = cd.fn if not is_autocast_enabled else autocast(cd.fn, dtype=autocast_thunder_dtype)
+        if not is_autocast_enabled:
+            processed_function = cd.fn
+        else:
+            processed_function = autocast_fn_cache.get(autocast_thunder_dtype)
+            if processed_function is None:
+                processed_function = autocast_fn_cache[autocast_thunder_dtype] = autocast(
+                    cd.fn, dtype=autocast_thunder_dtype
+                )
 
         # Resets use of compile flags
         cs.last_compile_reasons = defaultdict(list)
@@ -774,9 +1114,7 @@ def _create_callable(
             #   1) The grad() transform is not applied
             #   2) At least one input tensor (or tensor proxy) requires grad
             if not _using_grad_transform:
-                flat_args, _ = tree_flatten((args, kwargs))
-                tensor_cls = (torch.Tensor, TensorProxy)
-                requires_grad = any(isinstance(arg, tensor_cls) and arg.requires_grad for arg in flat_args)
+                requires_grad = _any_requires_grad(args) or _any_requires_grad(kwargs)
                 if not cd.disable_torch_autograd_support and requires_grad:
                     raise NotImplementedError(
                         "torch.autograd.Function integration is not supported in thunder.compile(). "
@@ -792,9 +1130,11 @@ def _create_callable(
 
             # Acquires the trace OR inlines the trace into an existing trace and
             #   returns the (proxied) result of the operation
-            cs.last_trace_tracing_start = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_tracing_start = time.perf_counter_ns()
             trc_or_result = trace(compile_data=cd)(processed_function, *args, **kwargs)
-            cs.last_trace_tracing_stop = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_tracing_stop = time.perf_counter_ns()
 
             # Checks for inlined transforms
             current_trace = get_tracectx()
@@ -822,7 +1162,8 @@ def _create_callable(
             # Executes the trace, then updates the CompiledData and possibly
             #   updates a cache
             #
-            cs.last_trace_host_execution_start = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_host_execution_start = time.perf_counter_ns()
             result, c, extraces = _execute_trace(
                 trc,
                 args=args,
@@ -830,28 +1171,31 @@ def _create_callable(
                 compile_data=cd,
                 transforms=transforms,
             )
-            cs.last_trace_host_execution_stop = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_host_execution_stop = time.perf_counter_ns()
 
             traces.extend(extraces)
             cs.last_traces = traces
             cs.last_executed = c
 
             # (Possibly) Updates the cache
-            if cd.cache_option is CACHE_OPTIONS.CONSTANT_VALUES:
+            if uses_constant_values_cache:
                 cache_put(
-                    cs.cache,
+                    cache,
                     c,
                     traces,
-                    args[cd.num_constant_args :],
+                    args[num_constant_args:],
                     kwargs,
                     autocast_key=None,
                     distributed_key=distributed_key,
                 )
 
-            cs.last_trace_host_stop = time.perf_counter_ns()
+            if record_timings:
+                cs.last_trace_host_stop = time.perf_counter_ns()
             return result
 
     # NOTE is_module is False
+    _fn = _light_wraps(cd.fn, _fn)
     _fn._lc_cd = cd
     _fn._lc_cs = cs
     _fn._lc_transforms = transforms
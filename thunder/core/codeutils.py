@@ -353,6 +353,15 @@ class SigInfo:
 #   and the kwargs and varkwargs into kwarg_values
 
 
+# Memoizes signature introspection, which walks the callable's __code__ and constructs
+#   Parameter objects -- expensive enough to matter when the same function is inspected
+#   on every trace
+# NOTE Signature objects are immutable, so sharing one across calls is safe
+@functools.lru_cache(maxsize=512)
+def _cached_signature(fn: Callable) -> inspect.Signature:
+    return inspect.signature(fn)
+
+
 # TODO RC1 Review errors and improve message quality (ex. too many arguments error)
 # TODO RC1 Have this always return a SigInfo or another type (maybe by wrapping in another function)
 def get_siginfo(fn: Callable, args, kwargs, *, _make_named_inputs: bool = False) -> SigInfo | Any:
@@ -391,7 +400,11 @@ def get_siginfo(fn: Callable, args, kwargs, *, _make_named_inputs: bool = False)
         fn_ = fn_.meta
 
     # Binds args and kwargs to signature
-    sig = inspect.signature(fn_)
+    try:
+        sig = _cached_signature(fn_)
+    except TypeError:
+        # NOTE Unhashable callables cannot be memoized
+        sig = inspect.signature(fn_)
     kwargs.update(partial_kwargs)
     ba = sig.bind(*args, **kwargs)
 
@@ -118,7 +118,7 @@ class ThunderModule(pytorch.nn.Module):
                 shared_names[n] = s
         return shared_names
 
-    def load_original_state_dict(self, state_dict):
+    def load_original_state_dict(self, state_dict, consume: bool = False):
         # this loads the state dict incrementally to not exhaust memory
         module_names = {n for n, _ in self._model.named_modules()}
         sd_per_module = collections.defaultdict(dict)
@@ -129,11 +129,23 @@ class ThunderModule(pytorch.nn.Module):
                 prefix, sep, _ = prefix.rpartition(".")
             sd_per_module[prefix][k[len(prefix) + len(sep) :]] = v
 
+        if consume:
+            # the caller hands over ownership of state_dict: emptying it here and
+            # dropping the per-module slices as they are loaded below lets each
+            # source tensor be freed right after its copy, instead of keeping the
+            # whole checkpoint alive alongside the materialized module
+            state_dict.clear()
+
         shared_names = self._get_shared_names()
         processed_names = set()
 
-        for submodule_name, sd_part in sd_per_module.items():
-            self._transform_and_load_for_submodule(submodule_name, sd_part, shared_names, processed_names)
+        if consume:
+            while sd_per_module:
+                submodule_name, sd_part = sd_per_module.popitem()
+                self._transform_and_load_for_submodule(submodule_name, sd_part, shared_names, processed_names)
+        else:
+            for submodule_name, sd_part in sd_per_module.items():
+                self._transform_and_load_for_submodule(submodule_name, sd_part, shared_names, processed_names)
 
     def _transform_and_load_for_submodule(self, submodule_name, sd_part, shared_names, processed_names):
         prefix = submodule_name + ("." if submodule_name else "")
@@ -221,7 +233,10 @@ class ThunderModule(pytorch.nn.Module):
         Args:
             state_dict: the state dict to load.
             strict: error on missing / unused state dict members
-            assign: assign the state dict tensors instead of copying the data
+            assign: assign the state dict tensors instead of copying the data;
+                    the assigned tensor is installed under every tied alias of
+                    the name and converted like a copy would be when device or
+                    dtype do not match
 
         This is similar much more simple than the original load_state_dict.
         (Regarding hooks, customization etc.)
@@ -235,7 +250,11 @@ class ThunderModule(pytorch.nn.Module):
         keys_unused = thunder.core.utils.OrderedSet(state_dict.keys())
         keys_missing = thunder.core.utils.OrderedSet()
         errors = []
-        for name, v in itertools.chain(self.named_parameters(), self.named_buffers()):
+        if assign:
+            shared_names = self._get_shared_names()
+        # the iteration is snapshotted because the assign branch below inserts
+        # alias keys into the override dicts the named_* iterators read from
+        for name, v in list(itertools.chain(self.named_parameters(), self.named_buffers())):
             if name in non_persistent_buffers_set:
                 continue
             if name not in state_dict:
@@ -260,14 +279,23 @@ class ThunderModule(pytorch.nn.Module):
             # We don't check dtype because PyTorch also does dtype conversion on load.
             with pytorch.no_grad():
                 if assign:
+                    # match the conversion copy_ would perform; meta targets take
+                    # their device from the materialization annotation when present
+                    target_device = getattr(v, "_thunder_device", None) if v.is_meta else v.device
+                    if target_device is not None:
+                        sd_v = sd_v.to(device=target_device, dtype=v.dtype)
                     if isinstance(v, pytorch.nn.Parameter):
                         if not isinstance(sd_v, pytorch.nn.Parameter):
                             sd_v = pytorch.nn.Parameter(sd_v, requires_grad=v.requires_grad)
                         else:
                             sd_v.requires_grad_(v.requires_grad)
-                        self._overrides_parameters[name] = sd_v
+                        # state dicts deduplicate tied weights, so the assigned tensor
+                        # is installed under every alias of the name
+                        for alias in shared_names[name]:
+                            self._overrides_parameters[alias] = sd_v
                     else:
-                        self._overrides_buffers[name] = sd_v
+                        for alias in shared_names[name]:
+                            self._overrides_buffers[alias] = sd_v
 
                 else:
                     v.copy_(sd_v)
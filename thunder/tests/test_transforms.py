@@ -110,6 +110,40 @@ def test_materialization():
     assert_close(actual, expected, rtol=1e-2, atol=1e-2)
 
 
+def test_materialization_init_from_transformed_state_dict_tied_weights():
+    from thunder.transforms import MaterializationTransform
+
+    class Model(torch.nn.Module):
+        def __init__(self) -> None:
+            super().__init__()
+            self.fc1 = torch.nn.Linear(4, 4, bias=False)
+            self.fc2 = torch.nn.Linear(4, 4, bias=False)
+            self.fc2.weight = self.fc1.weight
+
+        def forward(self, x):
+            x = self.fc1(x)
+            x = torch.nn.functional.relu(x)
+            x = self.fc2(x)
+            return x
+
+    ref_m = Model()
+    jm_ref = thunder.jit(ref_m, executors=())
+
+    with torch.device("meta"):
+        m = Model()
+
+    # the transformed state dict only has fc1.weight for the tied pair
+    init_from_transformed_sd = MaterializationTransform.init_from_transformed_state_dict(jm_ref.state_dict())
+    jm = thunder.jit(m, transforms=[MaterializationTransform("cpu", init=init_from_transformed_sd)], executors=())
+
+    x = torch.randn(2, 4)
+    assert_close(jm(x), jm_ref(x))
+
+    # both aliases must see the checkpoint weight, not a scratch allocation
+    assert jm.get_parameter("fc1.weight") is jm.get_parameter("fc2.weight")
+    assert_close(jm.get_parameter("fc1.weight"), jm_ref.get_parameter("fc1.weight"))
+
+
 @requiresCUDA
 def test_quantization_on_meta():
     from thunder.transforms import MaterializationTransform
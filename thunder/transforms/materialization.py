@@ -13,6 +13,20 @@ if TYPE_CHECKING:
     from thunder.core.module import ThunderModule
 
 
+# caches whether a module class implements reset_parameters, so repeated
+# submodules of the same type pay the MRO walk only once
+_has_reset_parameters: dict[type, bool] = {}
+
+
+def _named_params_and_buffers(model: ThunderModule):
+    # tags each entry so one materialization pass can tell parameters (which
+    # need the nn.Parameter wrap) from buffers
+    for n, p in model.named_parameters():
+        yield n, p, True
+    for n, b in model.named_buffers():
+        yield n, b, False
+
+
 class MaterializationTransform(Transform):
     """Materialize a model that can fit on a device only after transforms applied.
 
@@ -42,29 +56,83 @@ class MaterializationTransform(Transform):
         self.init = init
 
     def transform_module(self, model: ThunderModule):
-        for p in chain(model._model.parameters(), model._model.buffers()):
-            if p.device.type == "meta" and not hasattr(p, "_thunder_device"):
-                p._thunder_device = self.device
+        # NOTE self.device is normalized to a torch.device in __init__; keeping it in a
+        #   local and guaranteeing the annotations below are torch.device objects means
+        #   the factory calls in the loops never re-parse a device string per tensor
+        default_device = self.device
+
+        # a single named_modules walk stamps parameters and buffers together,
+        # peeking at the raw slots so that Module.parameters()/buffers() and their
+        # dedup memo are not run twice over the tree (re-stamping an alias is a
+        # no-op thanks to the getattr guard)
+        for _, m in model._model.named_modules():
+            # pure containers (Sequential, ModuleList, ...) own no tensors; the
+            # truthiness test skips them without building the tuple below
+            if not m._parameters and not m._buffers:
+                continue
+            for p in (*m._parameters.values(), *m._buffers.values()):
+                if p is not None and p.device.type == "meta":
+                    d = getattr(p, "_thunder_device", None)
+                    if d is None:
+                        p._thunder_device = default_device
+                    elif not isinstance(d, torch.device):
+                        # annotations stashed by other transforms are normalized once here
+                        p._thunder_device = torch.device(d)
 
         shared_names = model._get_shared_names()
 
-        # note: the iterations below are without duplicates
-        for n, p in list(model.named_parameters()):
-            if p.device.type == "meta":
-                p = torch.nn.Parameter(
-                    torch.empty_like(p, device=getattr(p, "_thunder_device", self.device)),
-                    requires_grad=p.requires_grad,
+        # most models have no tied weights, so every group in shared_names is the
+        # singleton {name}; detecting that once lets the loop below skip the
+        # group bookkeeping entirely
+        has_sharing = any(len(s) > 1 for s in shared_names.values())
+
+        # when the init promises to install source tensors directly (assign
+        # semantics), a scratch allocation here would be dropped again right away,
+        # so those names skip materialization; state dicts deduplicate tied
+        # weights, so a group counts as covered when any of its aliases is (the
+        # assign path installs the tensor under every alias)
+        assigns_directly = getattr(self.init, "assigns_directly", frozenset())
+
+        # tracks the replacement allocated for each source meta tensor, so aliases that
+        # surface under several names are materialized exactly once
+        materialized = WeakTensorKeyDictionary()
+
+        # note: the iteration below is without duplicates
+        # the snapshot (needed because the loop writes into the override store the
+        # iterators read from) keeps only the meta entries, so its size tracks what
+        # is left to materialize instead of the whole model
+        meta_entries = [
+            (n, t, is_param) for n, t, is_param in _named_params_and_buffers(model) if t.device.type == "meta"
+        ]
+        for n, t, is_param in meta_entries:
+            if assigns_directly:
+                covered = not shared_names[n].isdisjoint(assigns_directly) if has_sharing else n in assigns_directly
+                if covered:
+                    continue
+            new_t = materialized.get(t)
+            if new_t is None:
+                # NOTE torch.empty with explicit metadata is a cheaper factory path
+                #   than empty_like, which re-derives dtype/layout/memory format per
+                #   call before dispatching
+                new_t = torch.empty(
+                    t.shape,
+                    dtype=t.dtype,
+                    layout=t.layout,
+                    device=getattr(t, "_thunder_device", default_device),
                 )
-                for nn in shared_names[n]:
-                    model._overrides_parameters[nn] = p
-
-        for n, b in list(model.named_buffers()):
-            if b.device.type == "meta":
-                b = torch.empty_like(
-                    b, device=getattr(b, "_thunder_device", self.device), requires_grad=b.requires_grad
-                )
-                for nn in shared_names[n]:
-                    model._overrides_parameters[nn] = b
+                if is_param:
+                    new_t = torch.nn.Parameter(new_t, requires_grad=t.requires_grad)
+                elif t.requires_grad:
+                    # buffers rarely require grad, so the flag flip is skipped
+                    # in the common case
+                    new_t.requires_grad_(True)
+                materialized[t] = new_t
+            if has_sharing:
+                # one C-level update per alias group instead of a Python-level
+                # assignment per name
+                model._overrides_parameters.update(dict.fromkeys(shared_names[n], new_t))
+            else:
+                model._overrides_parameters[n] = new_t
 
         self.init(self, model)
 
@@ -72,7 +140,10 @@ class MaterializationTransform(Transform):
     def init_from_original_state_dict(state_dict):
         def module_init_from_original_state_dict(transform: MaterializationTransform, model: ThunderModule):
             # transform is unused
-            model.load_original_state_dict(state_dict)
+            # NOTE consume=True empties state_dict during the load so the source
+            #   tensors are freed incrementally instead of staying alive next to
+            #   the materialized parameters
+            model.load_original_state_dict(state_dict, consume=True)
 
         return module_init_from_original_state_dict
 
@@ -80,8 +151,11 @@ class MaterializationTransform(Transform):
     def init_from_transformed_state_dict(state_dict):
         def module_init_from_transformed_state_dict(transform: MaterializationTransform, model: ThunderModule):
             # transform is unused
-            model.load_state_dict(state_dict)
+            model.load_state_dict(state_dict, assign=True)
 
+        # advertise assign semantics so transform_module skips the scratch
+        # allocations that the load would immediately replace
+        module_init_from_transformed_state_dict.assigns_directly = frozenset(state_dict.keys())
         return module_init_from_transformed_state_dict
 
     @staticmethod
@@ -98,45 +172,81 @@ class MaterializationTransform(Transform):
             # in `shared_params_name` dictionary.
 
             for module_name, _ in tm._model.named_modules():
-                prefix = module_name if not module_name else f"{module_name}."
                 submodule = tm.get_submodule(module_name)
 
-                # we use a copy to let the user's module alone
-                module_copy = copy.copy(submodule)
+                # pure containers (Sequential, ModuleList, ...) own no tensors
+                # and are skipped with two truthiness tests, before any
+                # generator or chain setup
+                if not submodule._parameters and not submodule._buffers:
+                    continue
+
+                prefix = module_name if not module_name else f"{module_name}."
 
                 # Materialize meta-parameters on-device if necessary.
                 # This is done before sharding in case the materialization logic depends on the tensor shape.
                 # The tradeoff is that all of a module's direct parameters need to fit in device.
                 # Each module only initializes its own parameters and not those of its children (recurse=False)
-                if any(
-                    t.is_meta for t in chain(module_copy.parameters(recurse=False), module_copy.buffers(recurse=False))
+                # NOTE This peeks at the raw dicts so that already-materialized modules
+                #   and pure containers skip the (expensive) copy.copy below
+                if not any(
+                    t is not None and t.is_meta
+                    for t in chain(submodule._parameters.values(), submodule._buffers.values())
                 ):
-                    # we need to initialize the module unless all parameters are duplicatess
-                    need_init = not all(
-                        shared_names[n] & processed_names
-                        for n, _ in chain(
-                            module_copy.named_parameters(prefix=module_name, recurse=False),
-                            module_copy.named_buffers(prefix=module_name, recurse=False),
-                        )
-                    )
-
-                    if need_init:
-                        # TODO: we could also support calling a "param_init_fn" argument like PyTorch
-                        module_copy.to_empty(device=transform.device, recurse=False)
-                        if not hasattr(module_copy, "reset_parameters"):
-                            raise TypeError(
-                                f"Materialization requires that the `{type(submodule).__name__}.reset_parameters` method is implemented."
-                                " This method is used to initialize any children parameters or buffers in this module."
-                            )
-                        module_copy.reset_parameters()
-
-                    # TODO: non-persistent buffers?
-                    sd = {
-                        n: p
-                        for n, p in chain(
-                            module_copy.named_parameters(recurse=False), module_copy.named_buffers(recurse=False)
+                    continue
+
+                # we use a copy to let the user's module alone
+                module_copy = copy.copy(submodule)
+
+                # the module's direct parameters and buffers are needed several times
+                # below (need_init check, sd construction), so they are gathered once
+                # per submodule straight from the raw dicts instead of re-running the
+                # named_* iterator machinery for each use; the prefixed names are
+                # formatted once here rather than per lookup
+                params = [(n, p) for n, p in module_copy._parameters.items() if p is not None]
+                buffers = [(n, b) for n, b in module_copy._buffers.items() if b is not None]
+                prefixed_names = [f"{prefix}{n}" for n, _ in chain(params, buffers)]
+
+                # we need to initialize the module unless all parameters are duplicatess
+                # NOTE isdisjoint short-circuits without allocating the intersection
+                #   set that `&` would build per name
+                need_init = False
+                for pn in prefixed_names:
+                    group = shared_names[pn]
+                    if len(group) == 1:
+                        # the common untied case: a one-element group is disjoint
+                        # from processed_names iff the name itself is unprocessed,
+                        # which is a single O(1) membership test
+                        if pn not in processed_names:
+                            need_init = True
+                            break
+                    elif group.isdisjoint(processed_names):
+                        need_init = True
+                        break
+
+                if need_init:
+                    # TODO: we could also support calling a "param_init_fn" argument like PyTorch
+                    module_copy.to_empty(device=transform.device, recurse=False)
+                    cls = type(module_copy)
+                    has_reset = _has_reset_parameters.get(cls)
+                    if has_reset is None:
+                        has_reset = _has_reset_parameters.setdefault(cls, hasattr(cls, "reset_parameters"))
+                    if not has_reset:
+                        raise TypeError(
+                            f"Materialization requires that the `{type(submodule).__name__}.reset_parameters` method is implemented."
+                            " This method is used to initialize any children parameters or buffers in this module."
                         )
-                    }
-                    tm._transform_and_load_for_submodule(module_name, sd, shared_names, processed_names)
+                    module_copy.reset_parameters()
+                    # to_empty and reset_parameters replace the module's tensors,
+                    # so the cached views are refreshed (the names are unchanged,
+                    # so prefixed_names stays valid)
+                    params = [(n, p) for n, p in module_copy._parameters.items() if p is not None]
+                    buffers = [(n, b) for n, b in module_copy._buffers.items() if b is not None]
+
+                # TODO: non-persistent buffers?
+                # constructs the dict from the cached pair lists at C level rather than
+                # iterating a chained generator comprehension
+                sd = dict(params)
+                sd.update(buffers)
+                tm._transform_and_load_for_submodule(module_name, sd, shared_names, processed_names)
 
         return module_init_from_original_module_init